@@ -2,7 +2,7 @@ from mirascope.core import anthropic, prompt_template
 
 
 def parse_recommendation(response: anthropic.AnthropicCallResponse) -> tuple[str, str]:
-    title, author = response.content.split(" by ")
+    title, author = response.content.split(" by ", 1)
     return (title, author)
 
 
@@ -2,7 +2,7 @@ from mirascope.core import groq
 
 
 def parse_recommendation(response: groq.GroqCallResponse) -> tuple[str, str]:
-    title, author = response.content.split(" by ")
+    title, author = response.content.split(" by ", 1)
     return (title, author)
 
 
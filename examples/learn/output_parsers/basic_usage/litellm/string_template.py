@@ -2,7 +2,7 @@ from mirascope.core import litellm, prompt_template
 
 
 def parse_recommendation(response: litellm.OpenAICallResponse) -> tuple[str, str]:
-    title, author = response.content.split(" by ")
+    title, author = response.content.split(" by ", 1)
     return (title, author)
 
 
@@ -2,7 +2,7 @@ from mirascope.core import Messages, mistral
 
 
 def parse_recommendation(response: mistral.MistralCallResponse) -> tuple[str, str]:
-    title, author = response.content.split(" by ")
+    title, author = response.content.split(" by ", 1)
     return (title, author)
 
 
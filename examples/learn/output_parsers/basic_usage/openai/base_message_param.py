@@ -2,7 +2,7 @@ from mirascope.core import BaseMessageParam, openai
 
 
 def parse_recommendation(response: openai.OpenAICallResponse) -> tuple[str, str]:
-    title, author = response.content.split(" by ")
+    title, author = response.content.split(" by ", 1)
     return (title, author)
 
 
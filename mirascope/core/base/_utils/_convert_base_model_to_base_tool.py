@@ -7,10 +7,21 @@ from typing import Any, TypeVar, cast
 from pydantic import BaseModel, create_model
 
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._memoize import memoize
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 
 
+@memoize(maxsize=32)
+def _get_field_definitions(model: type[BaseModel]) -> dict[str, Any]:
+    """Returns the `create_model` field definitions for the fields of `model`."""
+    return {
+        field_name: (field_info.annotation, field_info)
+        for field_name, field_info in model.model_fields.items()
+    }
+
+
+@memoize()
 def convert_base_model_to_base_tool(
     model: type[BaseModel], base: type[BaseToolT]
 ) -> type[BaseToolT]:
@@ -27,15 +38,11 @@ def convert_base_model_to_base_tool(
     Returns:
         The constructed `BaseModelT` type.
     """
-    field_definitions = {
-        field_name: (field_info.annotation, field_info)
-        for field_name, field_info in model.model_fields.items()
-    }
     tool_type = create_model(
         f"{model.__name__}",
         __base__=base,
         __doc__=model.__doc__ if model.__doc__ else DEFAULT_TOOL_DOCSTRING,
-        **cast(dict[str, Any], field_definitions),
+        **cast(dict[str, Any], _get_field_definitions(model)),
     )
     tool_type.model_config = model.model_config | tool_type.model_config
     bases = list(tool_type.__bases__)
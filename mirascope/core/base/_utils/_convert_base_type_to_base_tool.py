@@ -6,10 +6,12 @@ from pydantic import BaseModel, create_model
 
 from ._base_type import BaseType
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._memoize import memoize
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 
 
+@memoize()
 def convert_base_type_to_base_tool(
     schema: type[BaseType], base: type[BaseToolT]
 ) -> type[BaseToolT]:
@@ -4,15 +4,35 @@ from collections.abc import Callable
 from typing import Any, TypeVar, cast, get_type_hints
 
 import jiter
-from docstring_parser import parse
+from docstring_parser import Docstring, parse
 from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
 
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._memoize import memoize
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 
 
+@memoize(maxsize=32)
+def _get_type_hints(fn: Callable) -> dict[str, Any]:
+    """Returns the type hints of `fn` (including extras) without re-resolving them."""
+    return get_type_hints(fn, include_extras=True)
+
+
+@memoize(maxsize=32)
+def _get_signature(fn: Callable) -> inspect.Signature:
+    """Returns the signature of `fn` without re-inspecting it."""
+    return inspect.signature(fn)
+
+
+@memoize()
+def _parse_docstring(doc: str) -> Docstring:
+    """Returns the parsed `doc` without re-parsing identical docstrings."""
+    return parse(doc)
+
+
+@memoize()
 def convert_function_to_base_tool(
     fn: Callable,
     base: type[BaseToolT],
@@ -44,20 +64,22 @@ def convert_function_to_base_tool(
     docstring, examples = None, []
     func_doc = __doc__ or fn.__doc__
     if func_doc:
-        docstring = parse(func_doc)
+        docstring = _parse_docstring(func_doc)
         for example in docstring.examples or []:
             if example.description:
                 examples.append(jiter.from_json(example.description.encode()))
 
     field_definitions = {}
-    hints = get_type_hints(fn, include_extras=True)
-    has_self = False
-    for i, parameter in enumerate(inspect.signature(fn).parameters.values()):
-        if parameter.name == "self":
-            has_self = True
-            continue
-        if parameter.name == "cls":
-            continue
+    hints = _get_type_hints(fn)
+    parameters = _get_signature(fn).parameters
+    has_self = "self" in parameters
+    # We skip `self` and `cls` up front so that indices line up with docstring params
+    fn_parameters = [
+        parameter
+        for parameter in parameters.values()
+        if parameter.name not in ("self", "cls")
+    ]
+    for i, parameter in enumerate(fn_parameters):
         if parameter.annotation == inspect.Parameter.empty:
             raise ValueError("All parameters must have a type annotation.")
 
@@ -101,19 +123,20 @@ def convert_function_to_base_tool(
     if examples:
         model.model_config["json_schema_extra"] = {"examples": examples}
 
+    # Resolve which argument of `fn` each field maps to once instead of on every call
+    fn_arg_names = {
+        field_name: field_info.alias if field_info.alias else field_name
+        for field_name, field_info in model.model_fields.items()
+        if field_name != "tool_call"
+    }
+
     def call(self: base) -> Any:  # noqa: ANN401
         return fn(
-            **(
-                ({"self": self} if has_self else {})
-                | {
-                    str(
-                        self.model_fields[field_name].alias
-                        if self.model_fields[field_name].alias
-                        else field_name
-                    ): getattr(self, field_name)
-                    for field_name in self.model_dump(exclude={"tool_call"})
-                }
-            )
+            **({"self": self} if has_self else {}),
+            **{
+                arg_name: getattr(self, field_name)
+                for field_name, arg_name in fn_arg_names.items()
+            },
         )
 
     async def call_async(self: base) -> Callable:
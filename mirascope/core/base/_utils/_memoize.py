@@ -0,0 +1,68 @@
+"""This module contains the `memoize` decorator."""
+
+from collections.abc import Callable
+from functools import lru_cache, wraps
+from types import MethodType
+from typing import Any, ParamSpec, TypeVar
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _identity(arg: Any) -> int | tuple[int, int] | None:  # noqa: ANN401
+    """Returns the identity of `arg` used alongside its value in the cache key."""
+    if isinstance(arg, str):
+        return None
+    if isinstance(arg, MethodType):
+        # Every attribute access creates a new bound method, so we use what it binds
+        return id(arg.__self__), id(arg.__func__)
+    return id(arg)
+
+
+def memoize(
+    maxsize: int | None = 128,
+) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Returns a decorator that caches the results of the decorated function.
+
+    Results are cached by the arguments of the call. Since some arguments compare equal
+    without being interchangeable (e.g. `Literal["a", "b"] == Literal["b", "a"]`), all
+    arguments other than strings must also be the very same objects to hit the cache
+    (for bound methods, the same function bound to the same object).
+    Calls with unhashable arguments (e.g. a method bound to a Pydantic model instance)
+    are not cached and instead go straight through to the decorated function.
+
+    Each cached entry keeps its arguments and result alive until it is evicted, so keep
+    `maxsize` small. Callers that build a new function or class on every call (e.g. a
+    tool defined inside a dynamic config) never hit the cache and get no benefit from it.
+
+    Args:
+        maxsize: The maximum number of results to cache. If `None`, the cache is
+            unbounded.
+
+    Returns:
+        The decorator. The uncached function is available as `__wrapped__`.
+    """
+
+    def decorator(fn: Callable[_P, _R]) -> Callable[_P, _R]:
+        @lru_cache(maxsize=maxsize)
+        def cached_fn(
+            ids: tuple[int | tuple[int, int] | None, ...],
+            args: tuple[Any, ...],
+            kwargs: tuple[tuple[str, Any], ...],
+        ) -> _R:
+            return fn(*args, **dict(kwargs))  # pyright: ignore [reportCallIssue]
+
+        @wraps(fn)
+        def inner(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            kwargs_items = tuple(kwargs.items())
+            try:
+                hash((args, kwargs_items))
+            except TypeError:
+                return fn(*args, **kwargs)
+            # The cached arguments are kept alive, so their ids can't be reused
+            ids = tuple(_identity(arg) for arg in (*args, *kwargs.values()))
+            return cached_fn(ids, args, kwargs_items)
+
+        return inner
+
+    return decorator
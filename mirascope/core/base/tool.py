@@ -9,6 +9,7 @@ import inspect
 import warnings
 from abc import abstractmethod
 from collections.abc import Callable
+from copy import deepcopy
 from typing import Any, ClassVar, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict
@@ -84,6 +85,7 @@ class BaseTool(BaseModel, Generic[_ToolSchemaT]):
     __custom_name__: ClassVar[str] = ""
     tool_config: ClassVar[ToolConfig] = ToolConfig()
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __json_schema_cache__: ClassVar[dict[tuple, dict[str, Any]]]
 
     @classmethod
     def _name(cls) -> str:
@@ -104,7 +106,7 @@ class BaseTool(BaseModel, Generic[_ToolSchemaT]):
         """The arguments of the tool as a dictionary."""
         return {
             field: getattr(self, field)
-            for field in self.model_fields
+            for field in type(self).model_fields
             if field != "tool_call"
         }
 
@@ -160,14 +162,24 @@ class BaseTool(BaseModel, Generic[_ToolSchemaT]):
         schema_generator: type[GenerateJsonSchema] = GenerateJsonSchemaNoTitles,
         mode: JsonSchemaMode = "validation",
     ) -> dict[str, Any]:
-        """Returns the generated JSON schema for the class."""
+        """Returns the generated JSON schema for the class.
+
+        The schema is generated once per class and set of arguments. Each call returns
+        a copy so that callers can freely modify it.
+        """
         cls.warn_for_unsupported_configurations()
-        return super().model_json_schema(
-            by_alias=by_alias,
-            ref_template=ref_template,
-            schema_generator=schema_generator,
-            mode=mode,
-        )
+        # We check `cls.__dict__` so that subclasses don't use their parent's schemas
+        if "__json_schema_cache__" not in cls.__dict__:
+            cls.__json_schema_cache__ = {}
+        key = (by_alias, ref_template, schema_generator, mode)
+        if key not in cls.__json_schema_cache__:
+            cls.__json_schema_cache__[key] = super().model_json_schema(
+                by_alias=by_alias,
+                ref_template=ref_template,
+                schema_generator=schema_generator,
+                mode=mode,
+            )
+        return deepcopy(cls.__json_schema_cache__[key])
 
     @classmethod
     def warn_for_unsupported_configurations(cls) -> None:
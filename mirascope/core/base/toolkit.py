@@ -84,7 +84,9 @@ class BaseToolKit(BaseModel, ABC):
                 # Replace non-self template variables with escaped double brackets so
                 # that templating `self` results in a future templateable string.
                 template = template.replace(f"{{{var}}}", f"{{{{{var}}}}}")
-            converted_method = convert_function_to_base_tool(
+            # We set this instance's fields on the converted type below, so we skip
+            # the memoized conversion to avoid sharing it between toolkit instances.
+            converted_method = convert_function_to_base_tool.__wrapped__(  # pyright: ignore [reportFunctionMemberAccess]
                 method, BaseTool, template.format(self=self), self.__namespace__
             )
             for key, value in self:
@@ -62,30 +62,18 @@ class VertexTool(BaseTool[Tool]):
         """
         model_schema = cls.model_json_schema()
         fn: dict[str, Any] = {"name": cls._name(), "description": cls._description()}
-        if model_schema["properties"]:
-            fn["parameters"] = model_schema
-        if model_schema["required"]:
-            fn["parameters"]["required"] = model_schema["required"]
-        if "parameters" in fn:
-            if "$defs" in fn["parameters"]:
+        if properties := model_schema.get("properties", {}):
+            if "$defs" in model_schema:
                 raise ValueError(
                     "Unfortunately Google's Vertex API cannot handle nested structures "
                     "with $defs."
                 )
-
-            def handle_enum_schema(prop_schema: dict[str, Any]) -> dict[str, Any]:
+            # `model_json_schema` returns a deep copy, so we can edit properties in place
+            for prop_schema in properties.values():
+                prop_schema.pop("default", None)
                 if "enum" in prop_schema:
                     prop_schema["format"] = "enum"
-                return prop_schema
-
-            fn["parameters"]["properties"] = {
-                prop: {
-                    key: value
-                    for key, value in handle_enum_schema(prop_schema).items()
-                    if key != "default"
-                }
-                for prop, prop_schema in fn["parameters"]["properties"].items()
-            }
+            fn["parameters"] = model_schema
         return Tool(function_declarations=[FunctionDeclaration(**fn)])
 
     @classmethod
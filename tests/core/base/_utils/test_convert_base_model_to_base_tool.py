@@ -26,3 +26,14 @@ def test_convert_base_model_to_base_tool() -> None:
         tool(title="The Name of the Wind", author="Patrick Rothfuss").call()  # type: ignore
         == "The Name of the Wind by Patrick Rothfuss"
     )
+
+
+def test_convert_base_model_to_base_tool_memoized() -> None:
+    """Tests that `convert_base_model_to_base_tool` reuses the converted type."""
+
+    class Book(BaseModel):
+        title: str
+        author: str
+
+    tool = convert_base_model_to_base_tool(Book, BaseTool)
+    assert convert_base_model_to_base_tool(Book, BaseTool) is tool
@@ -1,6 +1,6 @@
 """Tests the `_utils.convert_base_type_to_base_tool` module."""
 
-from typing import Annotated
+from typing import Annotated, Literal
 
 from mirascope.core.base._utils._convert_base_type_to_base_tool import (
     convert_base_type_to_base_tool,
@@ -19,3 +19,19 @@ def test_convert_base_type_to_base_tool() -> None:
     assert tool._name() == "str"
     assert tool._description() == DEFAULT_TOOL_DOCSTRING
     assert "value" in tool.model_fields
+
+
+def test_convert_base_type_to_base_tool_memoized() -> None:
+    """Tests that `convert_base_type_to_base_tool` reuses the converted type."""
+    int_list = list[int]
+    assert convert_base_type_to_base_tool(
+        int_list, BaseTool
+    ) is convert_base_type_to_base_tool(int_list, BaseTool)
+
+
+def test_convert_base_type_to_base_tool_memoized_by_identity() -> None:
+    """Tests that equal but differently ordered types are converted separately."""
+    ab_tool = convert_base_type_to_base_tool(Literal["a", "b"], BaseTool)  # type: ignore
+    ba_tool = convert_base_type_to_base_tool(Literal["b", "a"], BaseTool)  # type: ignore
+    assert ab_tool is not ba_tool
+    assert ba_tool.model_json_schema()["properties"]["value"]["enum"] == ["b", "a"]
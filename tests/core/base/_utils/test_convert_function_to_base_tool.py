@@ -24,6 +24,20 @@ def test_convert_function_to_base_tool() -> None:
     assert tool.call() == "The Name of the Wind by Patrick Rothfuss"
 
 
+def test_convert_function_to_base_tool_memoized() -> None:
+    """Tests that `convert_function_to_base_tool` reuses the converted type."""
+
+    def format_book(title: str, author: str) -> str:
+        """Returns the title and author nicely formatted."""
+        return f"{title} by {author}"
+
+    tool_type = convert_function_to_base_tool(format_book, BaseTool)
+    assert convert_function_to_base_tool(format_book, BaseTool) is tool_type
+    assert convert_function_to_base_tool(format_book, BaseTool, "Formats.") is not (
+        tool_type
+    )
+
+
 @pytest.mark.asyncio
 async def test_convert_async_function_to_base_tool() -> None:
     """Tests the `convert_function_to_base_tool` function with async functions."""
@@ -83,6 +97,23 @@ def test_convert_function_to_base_tool_with_self_argument() -> None:
     assert tool.call() == "The Name of the Wind"
 
 
+def test_convert_function_to_base_tool_with_self_argument_documented() -> None:
+    """Tests that docstring params line up with parameters after `self`."""
+
+    def format_book(self, title: str, author: str) -> str:
+        """Returns the title and author nicely formatted.
+
+        Args:
+            title: The title of the book.
+            author: The author of the book.
+        """
+        return f"{title} by {author}"
+
+    tool_type = convert_function_to_base_tool(format_book, BaseTool)
+    assert tool_type.model_fields["title"].description == "The title of the book."
+    assert tool_type.model_fields["author"].description == "The author of the book."
+
+
 def test_convert_function_to_base_tool_with_cls_argument() -> None:
     """Tests `convert_function_to_base_tool` with a function that takes `cls`."""
 
@@ -0,0 +1,94 @@
+"""Tests the `_utils.memoize` module."""
+
+import gc
+import weakref
+
+from pydantic import BaseModel
+
+from mirascope.core.base._utils._memoize import memoize
+
+
+def test_memoize() -> None:
+    """Tests the `memoize` decorator."""
+    calls = []
+
+    @memoize()
+    def double(value: int) -> int:
+        calls.append(value)
+        return value * 2
+
+    assert double(1) == 2
+    assert double(1) == 2
+    assert double(value=2) == 4
+    assert double(value=2) == 4
+    assert calls == [1, 2]
+    assert double.__wrapped__(1) == 2  # pyright: ignore [reportFunctionMemberAccess]
+    assert calls == [1, 2, 1]
+
+
+def test_memoize_matches_identity() -> None:
+    """Tests that `memoize` only reuses results for the very same arguments."""
+    calls = []
+
+    @memoize()
+    def first(values: tuple[int, ...], label: str) -> int:
+        calls.append(values)
+        return values[0]
+
+    values = (1, 2)
+    assert first(values, "first") == 1
+    assert first(values, "".join(["fir", "st"])) == 1
+    assert calls == [(1, 2)]
+    assert first(tuple(range(1, 3)), "first") == 1
+    assert calls == [(1, 2), (1, 2)]
+
+
+def test_memoize_unhashable_arguments() -> None:
+    """Tests that `memoize` calls through for unhashable arguments."""
+    calls = []
+
+    class Librarian(BaseModel):
+        def available_books(self) -> list[str]:
+            return ["The Name of the Wind"]
+
+    @memoize()
+    def count_books(books: list[str]) -> int:
+        calls.append(books)
+        return len(books)
+
+    assert count_books(["The Name of the Wind"]) == 1
+    assert count_books(["The Name of the Wind"]) == 1
+    assert len(calls) == 2
+
+    @memoize()
+    def get_name(fn) -> str:
+        return fn.__name__
+
+    assert get_name(Librarian().available_books) == "available_books"
+
+
+def test_memoize_bound_methods() -> None:
+    """Tests that `memoize` reuses results for methods bound to the same object."""
+    calls = []
+
+    class Librarian:
+        def available_books(self) -> list[str]:
+            return ["The Name of the Wind"]
+
+    @memoize(maxsize=1)
+    def get_name(fn) -> str:
+        calls.append(fn)
+        return fn.__name__
+
+    librarian = Librarian()
+    assert get_name(librarian.available_books) == "available_books"
+    assert get_name(librarian.available_books) == "available_books"
+    assert len(calls) == 1
+
+    # Evicting the entry must release the object the method is bound to
+    librarian_ref = weakref.ref(librarian)
+    del librarian, calls[:]
+    assert get_name(Librarian().available_books) == "available_books"
+    assert len(calls) == 1
+    gc.collect()
+    assert librarian_ref() is None
@@ -1,6 +1,7 @@
 """Tests for the `tool` module."""
 
 from abc import update_abstractmethods
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import BaseModel
@@ -116,6 +117,45 @@ def test_base_tool_type_conversion() -> None:
     assert isinstance(tool, BaseTool)
 
 
+def test_base_tool_model_json_schema_cached() -> None:
+    """Tests that `BaseTool.model_json_schema` is generated once per class."""
+
+    class FormatBook(BaseTool):
+        title: str
+
+    class FormatBookWithAuthor(FormatBook):
+        author: str
+
+    mock_model_json_schema = MagicMock(
+        side_effect=BaseModel.model_json_schema.__func__  # pyright: ignore [reportFunctionMemberAccess]
+    )
+    with patch.object(
+        BaseModel, "model_json_schema", classmethod(mock_model_json_schema)
+    ):
+        schema = FormatBook.model_json_schema()
+        assert schema == {
+            "properties": {"title": {"type": "string"}},
+            "required": ["title"],
+            "type": "object",
+        }
+        schema["properties"]["title"]["format"] = "enum"
+        assert FormatBook.model_json_schema() == {
+            "properties": {"title": {"type": "string"}},
+            "required": ["title"],
+            "type": "object",
+        }
+        assert mock_model_json_schema.call_count == 1
+        assert FormatBookWithAuthor.model_json_schema()["required"] == [
+            "title",
+            "author",
+        ]
+        FormatBookWithAuthor.model_json_schema()
+        assert [call.args[0] for call in mock_model_json_schema.call_args_list] == [
+            FormatBook,
+            FormatBookWithAuthor,
+        ]
+
+
 def test_base_tool_tool_schema_not_implemented() -> None:
     """Tests the `BaseTool` class when the `tool_schema` method is not implemented."""
 
@@ -118,6 +118,26 @@ def test_toolkit_multiple_method(mock_namespaces) -> None:
     )
 
 
+def test_toolkit_instances_do_not_share_tools(mock_namespaces) -> None:
+    """Tests that toolkit instances with identical templates get their own tools."""
+
+    class BookRecommendationToolKit(BaseToolKit):
+        """A toolkit for recommending books."""
+
+        reading_level: Literal["beginner", "advanced"]
+
+        @toolkit_tool
+        def format_book(self, title: str, author: str) -> str:
+            """Returns formatted title and author."""
+            return f"{title} ({self.reading_level}) by {author}"
+
+    beginner_tool = BookRecommendationToolKit(reading_level="beginner").create_tools()
+    advanced_tool = BookRecommendationToolKit(reading_level="advanced").create_tools()
+    assert beginner_tool[0] is not advanced_tool[0]
+    assert beginner_tool[0].reading_level == "beginner"  # pyright: ignore [reportAttributeAccessIssue]
+    assert advanced_tool[0].reading_level == "advanced"  # pyright: ignore [reportAttributeAccessIssue]
+
+
 def test_toolkit_tool_method_not_found() -> None:
     """Tests that a ValueError is raised when there's no `toolkit_tool` method."""
 
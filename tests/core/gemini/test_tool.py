@@ -70,6 +70,35 @@ def test_gemini_tool() -> None:
     )
 
 
+def test_gemini_tool_all_defaults() -> None:
+    """Tests the `GeminiTool` class when every field has a default."""
+
+    class FormatBookDefaults(GeminiTool):
+        """Returns the title and author nicely formatted."""
+
+        title: str = "The Name of the Wind"
+        author: str = "Patrick Rothfuss"
+
+    assert (
+        FormatBookDefaults.tool_schema().to_proto()
+        == Tool(
+            function_declarations=[
+                FunctionDeclaration(
+                    name="FormatBookDefaults",
+                    description="Returns the title and author nicely formatted.",
+                    parameters={
+                        "properties": {
+                            "title": {"type": "string"},
+                            "author": {"type": "string"},
+                        },
+                        "type": "object",
+                    },
+                )
+            ]
+        ).to_proto()
+    )
+
+
 def test_gemini_tool_no_nesting() -> None:
     """Tests the `GeminiTool` class with nested structures."""
 
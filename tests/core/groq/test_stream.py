@@ -1,5 +1,7 @@
 """Tests the `groq.stream` module."""
 
+from functools import lru_cache
+
 import pytest
 from groq.types.chat import (
     ChatCompletion,
@@ -26,84 +28,100 @@ from mirascope.core.groq.call_response_chunk import GroqCallResponseChunk
 from mirascope.core.groq.stream import GroqStream
 from mirascope.core.groq.tool import GroqTool
 
+_BASE_TOOL_CALL = ChoiceDeltaToolCall.model_construct(
+    index=0,
+    id="id",
+    function=ChoiceDeltaToolCallFunction.model_construct(
+        arguments='{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}',
+        name="FormatBook",
+    ),
+    type="function",
+)
+_BASE_USAGE = CompletionUsage.model_construct(
+    completion_tokens=1, prompt_tokens=1, total_tokens=2
+)
+_BASE_CHUNKS = [
+    ChatCompletionChunk.model_construct(
+        id="id",
+        choices=[
+            ChoiceChunk.model_construct(
+                delta=ChoiceDelta.model_construct(content="content", tool_calls=None),
+                index=0,
+            )
+        ],
+        created=0,
+        model="llama3-70b-8192",
+        object="chat.completion.chunk",
+        x_groq=None,
+    ),
+    ChatCompletionChunk.model_construct(
+        id="id",
+        choices=[
+            ChoiceChunk.model_construct(
+                delta=ChoiceDelta.model_construct(
+                    content=None, tool_calls=[_BASE_TOOL_CALL]
+                ),
+                index=0,
+            )
+        ],
+        created=0,
+        model="llama3-70b-8192",
+        object="chat.completion.chunk",
+        usage=_BASE_USAGE,
+        x_groq=None,
+    ),
+]
 
-def test_groq_stream() -> None:
-    """Tests the `GroqStream` class."""
-    assert GroqStream._provider == "groq"
 
-    class FormatBook(GroqTool):
-        """Returns the title and author nicely formatted."""
+class FormatBook(GroqTool):
+    """Returns the title and author nicely formatted."""
 
-        title: str
-        author: str
+    title: str
+    author: str
 
-        def call(self) -> None:
-            """Dummy call."""
+    def call(self) -> None:
+        """Dummy call."""
 
-    tool_call = ChoiceDeltaToolCall(
-        index=0,
+
+@lru_cache(maxsize=128)
+def _cached_tool_call(
+    name: str | None, arguments: str | None
+) -> ChatCompletionMessageToolCall:
+    """Returns the tool call for the given function name and arguments."""
+    return ChatCompletionMessageToolCall(
         id="id",
-        function=ChoiceDeltaToolCallFunction(
-            arguments='{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}',
-            name="FormatBook",
-        ),
+        function=Function.model_construct(arguments=arguments, name=name),
         type="function",
     )
-    usage = CompletionUsage(completion_tokens=1, prompt_tokens=1, total_tokens=2)
-    chunks = [
-        ChatCompletionChunk(
-            id="id",
-            choices=[
-                ChoiceChunk(
-                    delta=ChoiceDelta(content="content", tool_calls=None), index=0
-                )
-            ],
-            created=0,
-            model="llama3-70b-8192",
-            object="chat.completion.chunk",
-            x_groq=None,
-        ),
-        ChatCompletionChunk(
-            id="id",
-            choices=[
-                ChoiceChunk(
-                    delta=ChoiceDelta(
-                        content=None,
-                        tool_calls=[tool_call],
-                    ),
-                    index=0,
-                )
-            ],
-            created=0,
-            model="llama3-70b-8192",
-            object="chat.completion.chunk",
-            usage=usage,
-            x_groq=None,
-        ),
-    ]
 
-    tool_call = None
 
-    def generator():
-        nonlocal tool_call
-        for chunk in chunks:
-            call_response_chunk = GroqCallResponseChunk(chunk=chunk)
-            if tool_calls := call_response_chunk.chunk.choices[0].delta.tool_calls:
-                assert tool_calls[0].function
-                tool_call = ChatCompletionMessageToolCall(
-                    id="id",
-                    function=Function(**tool_calls[0].function.model_dump()),
-                    type="function",
-                )
-                yield (
-                    call_response_chunk,
-                    FormatBook.from_tool_call(tool_call),
-                )
-            else:
-                yield call_response_chunk, None
+@pytest.fixture()
+def mock_stream(
+    with_finish_reason: bool,
+) -> tuple[GroqStream, list[ChatCompletionMessageToolCall]]:
+    """Returns a `GroqStream` over the base chunks and the tool calls it streams."""
+    chunks = _BASE_CHUNKS
+    if with_finish_reason:
+        choice = _BASE_CHUNKS[1].choices[0].model_copy(update={"finish_reason": "stop"})
+        chunks = [
+            _BASE_CHUNKS[0],
+            _BASE_CHUNKS[1].model_copy(update={"choices": [choice]}),
+        ]
+
+    streamed_tool_calls: list[ChatCompletionMessageToolCall] = []
+    streamed_chunks: list[tuple[GroqCallResponseChunk, FormatBook | None]] = []
+    for chunk in chunks:
+        tool = None
+        if tool_calls := chunk.choices[0].delta.tool_calls:
+            function = tool_calls[0].function
+            assert function
+            tool_call = _cached_tool_call(function.name, function.arguments)
+            streamed_tool_calls.append(tool_call)
+            tool = FormatBook.from_tool_call(tool_call)
+        streamed_chunks.append((GroqCallResponseChunk(chunk=chunk), tool))
 
     stream = GroqStream(
-        stream=generator(),
+        stream=(streamed_chunk for streamed_chunk in streamed_chunks),
         metadata={},
         tool_types=[FormatBook],
         call_response_type=GroqCallResponse,
@@ -115,6 +133,17 @@ def test_groq_stream() -> None:
         call_params={},
         call_kwargs={},
     )
+    return stream, streamed_tool_calls
+
+
+@pytest.mark.parametrize("with_finish_reason", [False, True])
+def test_groq_stream(
+    mock_stream: tuple[GroqStream, list[ChatCompletionMessageToolCall]],
+    with_finish_reason: bool,
+) -> None:
+    """Tests the `GroqStream` class and its `construct_call_response` method."""
+    assert GroqStream._provider == "groq"
+    stream, streamed_tool_calls = mock_stream
 
     with pytest.raises(
         ValueError, match="No stream response, check if the stream has been consumed."
@@ -128,101 +157,10 @@ def test_groq_stream() -> None:
     assert stream.message_param == {
         "role": "assistant",
         "content": "content",
-        "tool_calls": [tool_call],
+        "tool_calls": streamed_tool_calls,
     }
-
-
-def test_construct_call_response() -> None:
-    """Tests the `GroqStream.construct_call_response` method."""
-
-    class FormatBook(GroqTool):
-        """Returns the title and author nicely formatted."""
-
-        title: str
-        author: str
-
-        def call(self) -> None:
-            """Dummy call."""
-
-    tool_call = ChoiceDeltaToolCall(
-        index=0,
-        id="id",
-        function=ChoiceDeltaToolCallFunction(
-            arguments='{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}',
-            name="FormatBook",
-        ),
-        type="function",
-    )
-    usage = CompletionUsage(completion_tokens=1, prompt_tokens=1, total_tokens=2)
-    chunks = [
-        ChatCompletionChunk(
-            id="id",
-            choices=[
-                ChoiceChunk(
-                    delta=ChoiceDelta(content="content", tool_calls=None), index=0
-                )
-            ],
-            created=0,
-            model="llama3-70b-8192",
-            object="chat.completion.chunk",
-            x_groq=None,
-        ),
-        ChatCompletionChunk(
-            id="id",
-            choices=[
-                ChoiceChunk(
-                    delta=ChoiceDelta(
-                        content=None,
-                        tool_calls=[tool_call],
-                    ),
-                    index=0,
-                    finish_reason="stop",
-                )
-            ],
-            created=0,
-            model="llama3-70b-8192",
-            object="chat.completion.chunk",
-            usage=usage,
-            x_groq=None,
-        ),
-    ]
-
-    tool_call = None
-
-    def generator():
-        nonlocal tool_call
-        for chunk in chunks:
-            call_response_chunk = GroqCallResponseChunk(chunk=chunk)
-            if tool_calls := call_response_chunk.chunk.choices[0].delta.tool_calls:
-                assert tool_calls[0].function
-                tool_call = ChatCompletionMessageToolCall(
-                    id="id",
-                    function=Function(**tool_calls[0].function.model_dump()),
-                    type="function",
-                )
-                yield (
-                    call_response_chunk,
-                    FormatBook.from_tool_call(tool_call),
-                )
-            else:
-                yield call_response_chunk, None
-
-    stream = GroqStream(
-        stream=generator(),
-        metadata={},
-        tool_types=[FormatBook],
-        call_response_type=GroqCallResponse,
-        model="llama3-70b-8192",
-        prompt_template="",
-        fn_args={},
-        dynamic_config=None,
-        messages=[{"role": "user", "content": "content"}],
-        call_params={},
-        call_kwargs={},
-    )
-
-    for _ in stream:
-        pass
+    if not with_finish_reason:
+        return
 
     tool_call = ChatCompletionMessageToolCall(
         id="id",
@@ -246,7 +184,7 @@ def test_construct_call_response() -> None:
         created=0,
         model="llama3-70b-8192",
         object="chat.completion",
-        usage=usage,
+        usage=_BASE_USAGE,
     )
     call_response = GroqCallResponse(
         metadata={},
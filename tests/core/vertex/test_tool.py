@@ -68,6 +68,23 @@ def test_vertex_tool() -> None:
     }
 
 
+def test_vertex_tool_all_defaults() -> None:
+    """Tests the `VertexTool` class when every field has a default."""
+
+    class FormatBookDefaults(VertexTool):
+        """Returns the title and author nicely formatted."""
+
+        title: str = "The Name of the Wind"
+        author: str = "Patrick Rothfuss"
+
+    func_decl = FormatBookDefaults.tool_schema().to_dict()["function_declarations"][0]
+    assert func_decl["name"] == "FormatBookDefaults"
+    assert func_decl["parameters"] == {
+        "properties": {"title": {"type_": "STRING"}, "author": {"type_": "STRING"}},
+        "type_": "OBJECT",
+    }
+
+
 def test_vertex_tool_no_nesting() -> None:
     """Tests the `VertexTool` class with nested structures."""
 